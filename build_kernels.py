@@ -0,0 +1,100 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8,<3.10"
+# dependencies = [
+#     "numba",
+#     "numpy",
+# ]
+# ///
+"""Ahead-of-time compile the flutter_gen_logo.py pixel kernels with Numba.
+
+Builds an ``imgkernels`` extension module next to this script. When it is
+present, flutter_gen_logo.py --numba loads it directly instead of paying the
+JIT compile on every run; otherwise the same kernels are JIT-compiled.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+from numba import prange
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+# Kernels operate in place on uint8 arrays and reproduce the exact per-pixel
+# semantics of the NumPy paths in flutter_gen_logo.py. prange runs as a plain
+# range when compiled without parallel=True (as in the AOT build).
+
+
+def adjust_brightness(arr, factor):
+    height, width = arr.shape[:2]
+    for y in prange(height):
+        for x in range(width):
+            if arr[y, x, 3] > 0:
+                for c in range(3):
+                    arr[y, x, c] = np.uint8(min(255.0, max(0.0, arr[y, x, c] * factor)))
+
+
+def invert_colors(arr):
+    height, width = arr.shape[:2]
+    for y in prange(height):
+        for x in range(width):
+            for c in range(3):
+                arr[y, x, c] = 255 - arr[y, x, c]
+
+
+def remove_color(arr, bg_r, bg_g, bg_b, tolerance):
+    height, width = arr.shape[:2]
+    for y in prange(height):
+        for x in range(width):
+            if (abs(np.int16(arr[y, x, 0]) - bg_r) <= tolerance and
+                    abs(np.int16(arr[y, x, 1]) - bg_g) <= tolerance and
+                    abs(np.int16(arr[y, x, 2]) - bg_b) <= tolerance):
+                arr[y, x, 3] = 0
+
+
+def blend_edges(alpha, smooth):
+    height, width = alpha.shape
+    for y in prange(height):
+        for x in range(width):
+            if 10 < alpha[y, x] < 245:
+                alpha[y, x] = smooth[y, x]
+
+
+# Exported name -> (kernel, signature) for the AOT module
+KERNELS = {
+    'adjust_brightness': (adjust_brightness, 'void(u1[:,:,:], f8)'),
+    'invert_colors': (invert_colors, 'void(u1[:,:,:])'),
+    'remove_color': (remove_color, 'void(u1[:,:,:], i8, i8, i8, i8)'),
+    'blend_edges': (blend_edges, 'void(u1[:,:], u1[:,:])'),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Ahead-of-time compile the flutter_gen_logo.py pixel kernels'
+    )
+    parser.add_argument(
+        '-o', '--output-dir',
+        type=Path,
+        default=Path(__file__).resolve().parent,
+        help='Directory for the compiled imgkernels module (default: next to this script)'
+    )
+    args = parser.parse_args()
+
+    from numba.pycc import CC
+
+    cc = CC('imgkernels')
+    cc.output_dir = str(args.output_dir)
+    for name, (kernel, signature) in KERNELS.items():
+        cc.export(name, signature)(kernel)
+
+    logger.info(f"Compiling imgkernels into {args.output_dir}...")
+    cc.compile()
+    logger.info("Done!")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,30 +9,52 @@
 """Generate branding images with text for light and dark themes."""
 
 import argparse
+import functools
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import yaml
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Resolved font path per requested family, so the probe list is walked once
+_font_path_cache: dict[Optional[str], Optional[str]] = {}
+
 
 def load_pubspec(pubspec_path: Path) -> dict:
     """Load and parse pubspec.yaml file."""
     try:
         with pubspec_path.open('r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     except Exception as e:
         logger.error(f"Failed to read {pubspec_path}: {e}")
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing the FreeType face for repeated requests."""
+    return ImageFont.truetype(font_path, font_size)
+
+
 def get_font(font_size: int, font_family: Optional[str] = None) -> ImageFont.FreeTypeFont:
     """Get the best available font for the given family and size."""
+    cached_path = _font_path_cache.get(font_family)
+    if cached_path is not None:
+        return _load_font(cached_path, font_size)
+    if font_family in _font_path_cache:
+        return ImageFont.load_default()
+
     font_paths = []
     
     if font_family:
@@ -56,14 +78,16 @@ def get_font(font_size: int, font_family: Optional[str] = None) -> ImageFont.Fre
     # Try each font path
     for font_path in font_paths:
         try:
-            font = ImageFont.truetype(font_path, font_size)
+            font = _load_font(font_path, font_size)
             logger.info(f"Using font: {font_path}")
+            _font_path_cache[font_family] = font_path
             return font
         except (OSError, IOError):
             continue
     
     # Final fallback to default font
     logger.warning("Could not load any TrueType font, using default")
+    _font_path_cache[font_family] = None
     return ImageFont.load_default()
 
 
@@ -73,6 +97,11 @@ def calculate_text_size(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.Fr
     return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
 
+def png_save_options(fast: bool = False) -> dict:
+    """Pillow PNG encoder options: zlib level 1 when fast, Pillow defaults otherwise."""
+    return {'optimize': False, 'compress_level': 1} if fast else {}
+
+
 def create_branding_image(
     text: str,
     output_path: Path,
@@ -81,7 +110,8 @@ def create_branding_image(
     height: int = 120,
     font_size: int = 48,
     font_family: Optional[str] = None,
-    background_color: Optional[tuple[int, int, int, int]] = None
+    background_color: Optional[tuple[int, int, int, int]] = None,
+    fast_png: bool = False
 ) -> None:
     """Create a branding image with the specified text and styling."""
     
@@ -106,7 +136,7 @@ def create_branding_image(
     # Save image
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(output_path, 'PNG')
+        img.save(output_path, 'PNG', **png_save_options(fast_png))
         logger.info(f"Created branding image: {output_path}")
     except Exception as e:
         logger.error(f"Failed to save {output_path}: {e}")
@@ -168,6 +198,11 @@ def main():
         action='store_true',
         help='Add solid background instead of transparent'
     )
+    parser.add_argument(
+        '--fast-png',
+        action='store_true',
+        help='Write PNGs with fast zlib compression (level 1): quicker builds, larger files'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -236,33 +271,32 @@ def main():
         # Normalize text for filename
         text_normalized = text.lower().replace(' ', '_')
         
-        # Generate light theme image
-        light_filename = output_pattern.format(text=text_normalized, theme='light')
-        light_output = output_dir / light_filename
-        create_branding_image(
-            text=text,
-            output_path=light_output,
-            text_color=light_color,
-            width=width,
-            height=height,
-            font_size=font_size,
-            font_family=font_family,
-            background_color=light_bg
-        )
-        
-        # Generate dark theme image
-        dark_filename = output_pattern.format(text=text_normalized, theme='dark')
-        dark_output = output_dir / dark_filename
-        create_branding_image(
-            text=text,
-            output_path=dark_output,
-            text_color=dark_color,
-            width=width,
-            height=height,
-            font_size=font_size,
-            font_family=font_family,
-            background_color=dark_bg
-        )
+        # Resolve the font once so both workers reuse the cached face
+        get_font(font_size, font_family)
+
+        # Light and dark theme images are independent, so render them concurrently
+        themes = [
+            ('light', light_color, light_bg),
+            ('dark', dark_color, dark_bg),
+        ]
+        with ThreadPoolExecutor(max_workers=len(themes)) as executor:
+            futures = [
+                executor.submit(
+                    create_branding_image,
+                    text=text,
+                    output_path=output_dir / output_pattern.format(text=text_normalized, theme=theme),
+                    text_color=text_color,
+                    width=width,
+                    height=height,
+                    font_size=font_size,
+                    font_family=font_family,
+                    background_color=background_color,
+                    fast_png=args.fast_png
+                )
+                for theme, text_color, background_color in themes
+            ]
+            for future in futures:
+                future.result()
         
         logger.info(f"Successfully generated branding images in {output_dir}/")
         
@@ -2,6 +2,7 @@
 # /// script
 # requires-python = ">=3.8,<3.10"
 # dependencies = [
+#     "numpy",
 #     "pillow",
 #     "pyyaml",
 #     "rembg",
@@ -11,15 +12,24 @@
 """Generate light and dark theme logo variants for Flutter apps with auto background removal."""
 
 import argparse
+import functools
 import logging
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, cast
+from types import SimpleNamespace
+from typing import Optional
 
+import numpy as np
 import yaml
 from PIL import Image
-from rembg import remove
+from rembg import new_session, remove
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -29,52 +39,164 @@ def load_pubspec(pubspec_path: Path) -> dict:
     """Load and parse pubspec.yaml file."""
     try:
         with pubspec_path.open('r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     except Exception as e:
         logger.error(f"Failed to read {pubspec_path}: {e}")
         sys.exit(1)
 
 
-def detect_edge_color(img: Image.Image, sample_size: int = 5) -> tuple:
-    """Detect the dominant color at the edges of the image.
+@functools.lru_cache(maxsize=None)
+def _numba_kernels() -> Optional[SimpleNamespace]:
+    """Load the per-pixel Numba kernels defined in build_kernels.py.
 
-    Samples pixels from the four edges and returns the most common color.
+    Prefers the ahead-of-time compiled ``imgkernels`` module produced by
+    build_kernels.py and otherwise JIT-compiles the same kernels on first use.
+    Kernels operate in place on uint8 arrays and reproduce the exact per-pixel
+    semantics of the NumPy paths. Returns None when Numba is not installed.
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
+    try:
+        import imgkernels
+    except ImportError:
+        pass
+    else:
+        logger.debug("Using AOT-compiled imgkernels")
+        kernel_names = ('adjust_brightness', 'invert_colors', 'remove_color', 'blend_edges')
+        return SimpleNamespace(**{name: getattr(imgkernels, name) for name in kernel_names})
 
-    width, height = img.size
-    pixels = img.load()
-    edge_colors = []
+    try:
+        from numba import njit
+    except ImportError:
+        logger.warning("numba is not installed, falling back to NumPy")
+        return None
 
-    # Sample from top and bottom edges
-    for x in range(0, width, max(1, width // sample_size)):
-        edge_colors.append(pixels[x, 0][:3])  # Top edge
-        edge_colors.append(pixels[x, height - 1][:3])  # Bottom edge
+    try:
+        import build_kernels
+    except ImportError:
+        logger.warning("build_kernels.py not found next to this script, falling back to NumPy")
+        return None
 
-    # Sample from left and right edges
-    for y in range(0, height, max(1, height // sample_size)):
-        edge_colors.append(pixels[0, y][:3])  # Left edge
-        edge_colors.append(pixels[width - 1, y][:3])  # Right edge
+    return SimpleNamespace(**{
+        name: njit(parallel=True, cache=True)(kernel)
+        for name, (kernel, _) in build_kernels.KERNELS.items()
+    })
 
-    # Find most common color
-    from collections import Counter
-    color_counts = Counter(edge_colors)
-    return color_counts.most_common(1)[0][0]
 
+# ONNX Runtime execution providers per --device choice, in priority order
+DEVICE_PROVIDERS = {
+    'cpu': ['CPUExecutionProvider'],
+    'cuda': ['CUDAExecutionProvider', 'CPUExecutionProvider'],
+    'coreml': ['CoreMLExecutionProvider', 'CPUExecutionProvider'],
+    'directml': ['DmlExecutionProvider', 'CPUExecutionProvider'],
+}
 
-def apply_alpha_matting(img: Image.Image) -> Image.Image:
-    """Apply alpha matting to smooth edges and improve transparency quality.
 
-    Uses a simple erosion-dilation technique to smooth alpha channel edges.
+def _quantized_model_path() -> Path:
+    """Return an INT8 copy of the U2-Net model, quantizing it on first use.
+
+    The quantized model is written next to rembg's downloaded FP32 weights and
+    reused on later runs.
+    """
+    from rembg.sessions.u2net import U2netSession
+
+    model_path = Path(U2netSession.download_models())
+    int8_path = model_path.with_name(f"{model_path.stem}.int8.onnx")
+    if int8_path.exists():
+        return int8_path
+
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info(f"Quantizing {model_path.name} to INT8 (one-time)...")
+    tmp_path = int8_path.with_name(f"{int8_path.stem}.tmp.onnx")
+    quantize_dynamic(str(model_path), str(tmp_path), weight_type=QuantType.QInt8)
+    tmp_path.replace(int8_path)
+    return int8_path
+
+
+@functools.lru_cache(maxsize=None)
+def _rembg_session(model_name: str = 'u2net', device: str = 'auto', quantize: bool = False):
+    """Create the rembg inference session once and reuse it for every call.
+
+    With device 'auto' rembg picks the execution provider itself. Otherwise the
+    providers for the device are requested, falling back to CPU when ONNX Runtime
+    was built without them or the session cannot be created on the device.
+    With quantize, a dynamically quantized INT8 U2-Net is loaded instead.
+    """
+    session_kwargs = {}
+    if quantize:
+        session_kwargs['model_path'] = str(_quantized_model_path())
+        model_name = 'u2net_custom'
+
+    if device == 'auto':
+        return new_session(model_name, **session_kwargs)
+
+    import onnxruntime
+
+    available = onnxruntime.get_available_providers()
+    providers = [p for p in DEVICE_PROVIDERS[device] if p in available]
+    if providers == ['CPUExecutionProvider'] and device != 'cpu':
+        logger.warning(f"ONNX Runtime has no {device} provider, running rembg on CPU")
+
+    try:
+        session = new_session(model_name, providers=providers, **session_kwargs)
+    except Exception as e:
+        if providers == ['CPUExecutionProvider']:
+            raise
+        logger.warning(f"Failed to create rembg session on {device} ({e}), running on CPU")
+        return new_session(model_name, providers=['CPUExecutionProvider'], **session_kwargs)
+
+    logger.info(f"rembg execution providers: {', '.join(providers)}")
+    return session
+
+
+def _as_rgba_array(img: Image.Image, writable: bool = True) -> np.ndarray:
+    """Return the pixels of an image as an (H, W, 4) uint8 RGBA array.
+
+    Images that are already RGBA are not converted again. Pillow exposes pixels
+    through tobytes(), so the result never shares memory with the image. The
+    array is writable unless writable is False, in which case a read-only
+    array is returned (one copy instead of two).
     """
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
+    return np.array(img) if writable else np.asarray(img)
+
+
+def _detect_edge_color_array(arr: np.ndarray, sample_size: int = 5) -> tuple:
+    """Detect the dominant edge color of an (H, W, C) array; see detect_edge_color."""
+    rgb = arr[..., :3]
+    height, width = rgb.shape[:2]
+    x_step = max(1, width // sample_size)
+    y_step = max(1, height // sample_size)
+
+    # Sample from top/bottom and left/right edges, interleaved in scan order
+    horizontal = np.stack([rgb[0, ::x_step], rgb[-1, ::x_step]], axis=1).reshape(-1, 3)
+    vertical = np.stack([rgb[::y_step, 0], rgb[::y_step, -1]], axis=1).reshape(-1, 3)
+    edge_colors = np.concatenate([horizontal, vertical]).astype(np.uint32)
 
+    # Pack RGB into a single integer so each color is one scalar
+    packed = (edge_colors[:, 0] << 16) | (edge_colors[:, 1] << 8) | edge_colors[:, 2]
+
+    # Find most common color (ties go to the first sampled, like Counter)
+    colors, first_index, counts = np.unique(packed, return_index=True, return_counts=True)
+    candidates = np.flatnonzero(counts == counts.max())
+    color = int(colors[candidates[first_index[candidates].argmin()]])
+    return ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+
+
+def detect_edge_color(img: Image.Image, sample_size: int = 5) -> tuple:
+    """Detect the dominant color at the edges of the image.
+
+    Samples pixels from the four edges and returns the most common color.
+    """
+    return _detect_edge_color_array(_as_rgba_array(img, writable=False), sample_size)
+
+
+def _apply_alpha_matting_array(arr: np.ndarray, use_numba: bool = False) -> np.ndarray:
+    """Smooth the alpha channel of an RGBA array in place; see apply_alpha_matting."""
     from PIL import ImageFilter
 
     # Extract alpha channel
-    r, g, b, a = img.split()
+    a = Image.fromarray(arr[..., 3], 'L')
 
     # Apply slight blur to alpha channel for smoother edges
     a_smooth = a.filter(ImageFilter.GaussianBlur(radius=1))
@@ -85,112 +207,149 @@ def apply_alpha_matting(img: Image.Image) -> Image.Image:
     a_dilated = a_eroded.filter(ImageFilter.MaxFilter(3))
 
     # Blend between original and smoothed alpha based on edge proximity
-    pixels_orig = a.load()
-    pixels_smooth = a_dilated.load()
-    result_alpha = a.copy()
-    result_pixels = result_alpha.load()
+    a_smoothed = np.asarray(a_dilated)
 
-    width, height = a.size
+    # For semi-transparent pixels (edges), use smoothed version
+    kernels = _numba_kernels() if use_numba else None
+    if kernels is not None:
+        kernels.blend_edges(arr[..., 3], a_smoothed)
+    else:
+        edge = (arr[..., 3] > 10) & (arr[..., 3] < 245)
+        np.copyto(arr[..., 3], a_smoothed, where=edge)
 
-    for y in range(height):
-        for x in range(width):
-            orig_val = pixels_orig[x, y]
-            smooth_val = pixels_smooth[x, y]
+    return arr
 
-            # For semi-transparent pixels (edges), use smoothed version
-            if 10 < orig_val < 245:
-                result_pixels[x, y] = smooth_val
-            else:
-                result_pixels[x, y] = orig_val
 
-    # Recombine channels
-    return Image.merge('RGBA', (r, g, b, result_alpha))
+def apply_alpha_matting(img: Image.Image, use_numba: bool = False) -> Image.Image:
+    """Apply alpha matting to smooth edges and improve transparency quality.
 
+    Uses a simple erosion-dilation technique to smooth alpha channel edges.
+    """
+    return Image.fromarray(_apply_alpha_matting_array(_as_rgba_array(img), use_numba), 'RGBA')
 
-def remove_background_by_color(img: Image.Image, bg_color: tuple = None, tolerance: int = 30) -> Image.Image:
-    """Remove background by detecting edge color and making similar pixels transparent."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
 
+def _color_match_mask(arr: np.ndarray, bg_color: tuple, tolerance: int) -> np.ndarray:
+    """Mask of pixels whose RGB channels are all within tolerance of bg_color."""
+    rgb = arr[..., :3]
+    bg = np.array(bg_color[:3], dtype=np.uint8)
+
+    # |rgb - bg| stays in uint8 lanes: max - min cannot underflow, so there is
+    # no widened int16 copy, and one max reduction replaces three compares
+    diff = np.maximum(rgb, bg) - np.minimum(rgb, bg)
+    return diff.max(axis=-1) <= tolerance
+
+
+def _remove_background_by_color_array(
+    arr: np.ndarray, bg_color: tuple = None, tolerance: int = 30, use_numba: bool = False
+) -> np.ndarray:
+    """Clear alpha of background-colored pixels of an RGBA array in place."""
     # Auto-detect background color from edges if not provided
     if bg_color is None:
-        bg_color = detect_edge_color(img)
+        bg_color = _detect_edge_color_array(arr)
         logger.info(f"Detected edge color: RGB{bg_color}")
 
-    pixels = img.load()
-    width, height = img.size
+    kernels = _numba_kernels() if use_numba else None
+    if kernels is not None:
+        kernels.remove_color(arr, bg_color[0], bg_color[1], bg_color[2], tolerance)
+        return arr
 
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            # Check if pixel is similar to background color
-            if (abs(r - bg_color[0]) <= tolerance and
-                abs(g - bg_color[1]) <= tolerance and
-                abs(b - bg_color[2]) <= tolerance):
-                pixels[x, y] = (r, g, b, 0)  # Make transparent
+    # Make pixels similar to background color transparent
+    arr[..., 3][_color_match_mask(arr, bg_color, tolerance)] = 0
 
-    return img
+    return arr
 
 
-def remove_background_hybrid(img: Image.Image, tolerance: int = 30) -> Image.Image:
-    """Hybrid background removal: use rembg for region detection, color detection for cleanup.
+def remove_background_by_color(
+    img: Image.Image, bg_color: tuple = None, tolerance: int = 30, use_numba: bool = False
+) -> Image.Image:
+    """Remove background by detecting edge color and making similar pixels transparent."""
+    arr = _remove_background_by_color_array(_as_rgba_array(img), bg_color, tolerance, use_numba)
+    return Image.fromarray(arr, 'RGBA')
 
-    Steps:
-    1. Use rembg to identify the logo region (subject mask)
-    2. Detect background color from image edges
-    3. Remove background color pixels that are outside the logo region
-    """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
 
+def _remove_background_hybrid_array(
+    arr: np.ndarray, tolerance: int = 30, device: str = 'auto', quantize: bool = False
+) -> np.ndarray:
+    """Replace the alpha of an RGBA array in place; see remove_background_hybrid."""
     # Step 1: Get logo region from rembg
     logger.info("Using AI model to detect logo region...")
-    rembg_result = remove(img)
+    session = _rembg_session(device=device, quantize=quantize)
+    rembg_result = remove(Image.fromarray(arr, 'RGBA'), session=session)
 
     # Step 2: Detect background color
-    bg_color = detect_edge_color(img)
+    bg_color = _detect_edge_color_array(arr)
     logger.info(f"Detected background color: RGB{bg_color}")
 
     # Step 3: Combine both approaches
     # Use rembg's alpha as a guide, but also remove background color
-    original_pixels = img.load()
-    rembg_pixels = rembg_result.load()
-    result = img.copy()
-    result_pixels = result.load()
+    rembg_alpha = np.asarray(rembg_result)[..., 3]
+
+    # Check which pixels are similar to background color
+    color_match = _color_match_mask(arr, bg_color, tolerance)
+
+    # If rembg marked as transparent, definitely make it transparent
+    # If rembg marked as opaque, drop it only if it's background color
+    # For semi-transparent pixels, keep rembg's alpha
+    opaque = rembg_alpha > 245
+    arr[..., 3] = np.where(
+        rembg_alpha < 10, 0,
+        np.where(opaque & color_match, 0, np.where(opaque, 255, rembg_alpha)),
+    )
 
-    width, height = img.size
+    return arr
 
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = original_pixels[x, y]
-            rembg_alpha = rembg_pixels[x, y][3]
-
-            # If rembg marked as transparent, definitely make it transparent
-            if rembg_alpha < 10:
-                result_pixels[x, y] = (r, g, b, 0)
-            # If rembg marked as opaque, check if it's background color
-            elif rembg_alpha > 245:
-                # Check if it's similar to background color
-                if (abs(r - bg_color[0]) <= tolerance and
-                    abs(g - bg_color[1]) <= tolerance and
-                    abs(b - bg_color[2]) <= tolerance):
-                    result_pixels[x, y] = (r, g, b, 0)
-                else:
-                    result_pixels[x, y] = (r, g, b, 255)
-            # For semi-transparent pixels, keep rembg's alpha
-            else:
-                result_pixels[x, y] = (r, g, b, rembg_alpha)
 
-    return result
+def remove_background_hybrid(
+    img: Image.Image, tolerance: int = 30, device: str = 'auto', quantize: bool = False
+) -> Image.Image:
+    """Hybrid background removal: use rembg for region detection, color detection for cleanup.
+
+    Steps:
+    1. Use rembg to identify the logo region (subject mask)
+    2. Detect background color from image edges
+    3. Remove background color pixels that are outside the logo region
+    """
+    arr = _remove_background_hybrid_array(_as_rgba_array(img), tolerance, device, quantize)
+    return Image.fromarray(arr, 'RGBA')
 
 
-def remove_background_rembg(img: Image.Image) -> Image.Image:
+def remove_background_rembg(img: Image.Image, device: str = 'auto', quantize: bool = False) -> Image.Image:
     """Remove background from image using rembg AI model."""
     logger.info("Removing background with AI model (rembg)...")
-    return remove(img)
+    return remove(img, session=_rembg_session(device=device, quantize=quantize))
 
 
-def adjust_brightness(img: Image.Image, factor: float) -> Image.Image:
+def _adjust_brightness_array(
+    arr: np.ndarray, factor: float, use_numba: bool = False, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Scale visible RGB pixels of an RGBA array; see adjust_brightness.
+
+    Works in place unless out is given, in which case arr is only read and the
+    result is written into out.
+    """
+    if out is None:
+        out = arr
+
+    kernels = _numba_kernels() if use_numba else None
+    if kernels is not None:
+        # The kernel only works in place, so seed out with the source pixels
+        if out is not arr:
+            out[...] = arr
+        kernels.adjust_brightness(out, factor)
+        return out
+
+    # Scale and clip in one buffer, then keep the original RGB of invisible pixels
+    rgb = arr[..., :3]
+    scaled = rgb * np.float64(factor)
+    np.clip(scaled, 0, 255, out=scaled)
+    out[..., :3] = np.where((arr[..., 3] > 0)[..., None], scaled.astype(np.uint8), rgb)
+    if out is not arr:
+        out[..., 3] = arr[..., 3]
+
+    return out
+
+
+def adjust_brightness(img: Image.Image, factor: float, use_numba: bool = False) -> Image.Image:
     """Adjust brightness of non-transparent pixels.
 
     Args:
@@ -199,40 +358,45 @@ def adjust_brightness(img: Image.Image, factor: float) -> Image.Image:
                 > 1.0: brighten (e.g., 1.2 = 20% brighter)
                 < 1.0: darken (e.g., 0.8 = 20% darker)
                 = 1.0: no change
+        use_numba: Use the compiled Numba kernel when available
     """
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
 
-    pixels = img.load()
-    width, height = img.size
+    if use_numba:
+        return Image.fromarray(_adjust_brightness_array(_as_rgba_array(img), factor, use_numba), 'RGBA')
 
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            # Only adjust visible pixels
-            if a > 0:
-                r = int(min(255, max(0, r * factor)))
-                g = int(min(255, max(0, g * factor)))
-                b = int(min(255, max(0, b * factor)))
-                pixels[x, y] = (r, g, b, a)
+    # Scale RGB through a lookup table in libImaging, leaving alpha as is
+    lut = [int(min(255, max(0, v * factor))) for v in range(256)]
+    scaled = img.point(lut * 3 + list(range(256)))
 
-    return img
+    # Only adjust visible pixels
+    visible = img.getchannel('A').point(lambda v: 255 if v > 0 else 0)
+    return Image.composite(scaled, img, visible)
 
 
-def trim_transparent_borders(img: Image.Image, threshold: int = 10) -> Image.Image:
-    """Trim transparent borders from image."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
+def _trim_transparent_borders_array(arr: np.ndarray, threshold: int = 10) -> np.ndarray:
+    """Return a view of an RGBA array cropped to pixels with alpha above threshold."""
+    opaque = arr[..., 3] > threshold
+
+    # Get bounding box of pixels above the alpha threshold
+    cols = np.any(opaque, axis=0)
+    rows = np.any(opaque, axis=1)
 
-    # Get the alpha channel
-    alpha = img.split()[-1]
+    if not cols.any():
+        return arr
+    x0, x1 = cols.argmax(), len(cols) - cols[::-1].argmax()
+    y0, y1 = rows.argmax(), len(rows) - rows[::-1].argmax()
+    return arr[y0:y1, x0:x1]
 
-    # Get bounding box of non-transparent pixels
-    bbox = alpha.getbbox()
 
-    if bbox:
-        return img.crop(bbox)
-    return img
+def trim_transparent_borders(img: Image.Image, threshold: int = 10) -> Image.Image:
+    """Trim transparent borders from image.
+
+    Pixels with alpha at or below ``threshold`` count as transparent.
+    """
+    arr = _trim_transparent_borders_array(_as_rgba_array(img, writable=False), threshold)
+    return Image.fromarray(arr, 'RGBA')
 
 
 def resize_image(img: Image.Image, target_size: int, padding_ratio: float = 0.15) -> Image.Image:
@@ -257,6 +421,14 @@ def resize_image(img: Image.Image, target_size: int, padding_ratio: float = 0.15
     new_width = int(width * scale)
     new_height = int(height * scale)
 
+    # For large downscales, box-reduce by an integer factor first (cheap, in C),
+    # keeping at least a 2x step for the final LANCZOS pass. Done explicitly
+    # because Image.resize drops reducing_gap for RGBA images.
+    reduce_factor = int(min(width / max(new_width, 1), height / max(new_height, 1)) / 2)
+    if reduce_factor >= 2:
+        logger.debug(f"Box-reducing {width}x{height} by {reduce_factor}x before LANCZOS")
+        img = img.reduce(reduce_factor)
+
     # Resize with high-quality resampling
     resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
@@ -292,54 +464,69 @@ def add_background_for_theme(img: Image.Image, theme: str) -> Image.Image:
     return background
 
 
+def _average_brightness_array(arr: np.ndarray) -> float:
+    """Average Rec. 709 brightness of visible pixels in an RGBA array."""
+    # Only consider non-transparent pixels
+    visible = arr[..., 3] > 0
+    if not visible.any():
+        return 128.0  # Default to mid-brightness
+
+    # Rec. 709 coefficients for perceived brightness
+    weights = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+    brightness = arr[..., :3].astype(np.float32) @ weights
+    return float(brightness[visible].mean())
+
+
 def calculate_average_brightness(img: Image.Image) -> float:
     """Calculate average perceived brightness of non-transparent pixels."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
+    return _average_brightness_array(_as_rgba_array(img, writable=False))
 
-    total_brightness = 0.0
-    pixel_count = 0
 
-    pixels_raw = img.load()
-    assert pixels_raw is not None
-    pixels: Any = pixels_raw
-    width, height = img.size
-
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            # Only consider non-transparent pixels
-            if a > 0:
-                # Rec. 709 coefficients for perceived brightness
-                brightness = 0.2126 * r + 0.7152 * g + 0.0722 * b
-                total_brightness += brightness
-                pixel_count += 1
-
-    if pixel_count > 0:
-        return total_brightness / pixel_count
+def _invert_colors_array(arr: np.ndarray, use_numba: bool = False) -> np.ndarray:
+    """Invert the RGB channels of an RGBA array in place, keeping alpha."""
+    kernels = _numba_kernels() if use_numba else None
+    if kernels is not None:
+        kernels.invert_colors(arr)
     else:
-        return 128.0  # Default to mid-brightness
+        arr[..., :3] = 255 - arr[..., :3]
+    return arr
 
 
-def invert_logo_colors(img: Image.Image) -> Image.Image:
+def invert_logo_colors(img: Image.Image, use_numba: bool = False) -> Image.Image:
     """Invert RGB colors while preserving alpha channel."""
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
 
-    inverted = Image.new('RGBA', img.size)
-    pixels_raw = img.load()
-    inverted_pixels_raw = inverted.load()
-    assert pixels_raw is not None and inverted_pixels_raw is not None
-    pixels: Any = pixels_raw
-    inverted_pixels: Any = inverted_pixels_raw
-    width, height = img.size
+    if use_numba:
+        return Image.fromarray(_invert_colors_array(_as_rgba_array(img), use_numba), 'RGBA')
+
+    from PIL import ImageChops
+
+    r, g, b, a = img.split()
+    return Image.merge('RGBA', (ImageChops.invert(r), ImageChops.invert(g), ImageChops.invert(b), a))
+
 
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            inverted_pixels[x, y] = (255 - r, 255 - g, 255 - b, a)
+def png_save_options(fast: bool = False) -> dict:
+    """Pillow PNG encoder options: zlib level 1 when fast, Pillow defaults otherwise."""
+    return {'optimize': False, 'compress_level': 1} if fast else {}
 
-    return inverted
+
+def save_theme_variant(
+    arr: np.ndarray, theme: str, factor: float, output_path: Path,
+    use_numba: bool = False, fast_png: bool = False
+) -> None:
+    """Save a brightness-adjusted RGBA logo buffer as a theme variant.
+
+    arr is only read; adjusted pixels go straight into a buffer owned by this
+    variant, so concurrent variants can share the same base array.
+    """
+    variant = arr
+    if factor != 1.0:
+        variant = _adjust_brightness_array(arr, factor, use_numba=use_numba, out=np.empty_like(arr))
+        logger.info(f"Adjusted brightness for {theme} theme: {factor}x")
+    # Keep transparent background for icons
+    Image.fromarray(variant, 'RGBA').save(output_path, **png_save_options(fast_png))
+    logger.info(f"Saved {theme} theme logo (transparent): {output_path}")
 
 
 def run_flutter_command(command: list[str]) -> bool:
@@ -413,6 +600,17 @@ def main():
         action='store_true',
         help='Use color detection only (no AI model)'
     )
+    parser.add_argument(
+        '--device',
+        choices=['auto'] + list(DEVICE_PROVIDERS),
+        default='auto',
+        help='Device for rembg inference (default: auto = let rembg choose)'
+    )
+    parser.add_argument(
+        '--quantize',
+        action='store_true',
+        help='Run rembg with an INT8-quantized U2-Net (generated once, faster on CPU)'
+    )
     parser.add_argument(
         '--no-remove-bg',
         action='store_true',
@@ -434,6 +632,16 @@ def main():
         action='store_true',
         help='Skip alpha matting (edge smoothing)'
     )
+    parser.add_argument(
+        '--numba',
+        action='store_true',
+        help='Use Numba-compiled pixel kernels (requires numba, falls back to NumPy)'
+    )
+    parser.add_argument(
+        '--fast-png',
+        action='store_true',
+        help='Write PNGs with fast zlib compression (level 1): quicker builds, larger files'
+    )
     parser.add_argument(
         '--no-apply',
         action='store_true',
@@ -478,9 +686,9 @@ def main():
     logger.info(f"Target size: {target_size}x{target_size}")
     logger.info(f"Padding: {padding}px")
 
-    # Load input image
+    # Load input image once into a single RGBA buffer shared by every stage
     try:
-        img = Image.open(input_path)
+        arr = _as_rgba_array(Image.open(input_path))
     except Exception as e:
         logger.error(f"Failed to open {input_path}: {e}")
         sys.exit(1)
@@ -490,15 +698,18 @@ def main():
         try:
             if args.use_rembg:
                 # Use only AI model
-                img = remove_background_rembg(img)
+                img = remove_background_rembg(Image.fromarray(arr, 'RGBA'), device=args.device, quantize=args.quantize)
+                arr = _as_rgba_array(img)
                 logger.info("Background removed using AI model only")
             elif args.use_color_only:
                 # Use only color detection
-                img = remove_background_by_color(img, tolerance=args.bg_tolerance)
+                arr = _remove_background_by_color_array(arr, tolerance=args.bg_tolerance, use_numba=args.numba)
                 logger.info(f"Background removed using edge detection only (tolerance: {args.bg_tolerance})")
             else:
                 # Default: hybrid approach (AI region + color cleanup)
-                img = remove_background_hybrid(img, tolerance=args.bg_tolerance)
+                arr = _remove_background_hybrid_array(
+                    arr, tolerance=args.bg_tolerance, device=args.device, quantize=args.quantize
+                )
                 logger.info(f"Background removed using hybrid approach (AI + color, tolerance: {args.bg_tolerance})")
         except Exception as e:
             logger.warning(f"Failed to remove background: {e}")
@@ -509,7 +720,7 @@ def main():
     # Trim transparent borders unless skipped
     if not args.no_trim:
         try:
-            img = trim_transparent_borders(img)
+            arr = _trim_transparent_borders_array(arr)
             logger.info("Trimmed transparent borders")
         except Exception as e:
             logger.warning(f"Failed to trim borders: {e}")
@@ -517,14 +728,18 @@ def main():
     # Apply alpha matting unless skipped
     if not args.no_alpha_matting:
         try:
-            img = apply_alpha_matting(img)
+            arr = _apply_alpha_matting_array(arr, use_numba=args.numba)
             logger.info("Applied alpha matting for smoother edges")
         except Exception as e:
             logger.warning(f"Failed to apply alpha matting: {e}")
 
-    # Resize to target size
+    # Resize to target size (resampling is the one stage that needs a PIL image)
     try:
-        img = resize_image(img, target_size, padding_ratio=padding / target_size if padding else 0.15)
+        img = resize_image(Image.fromarray(arr, 'RGBA'), target_size,
+                           padding_ratio=padding / target_size if padding else 0.15)
+        # Read-only array (a single tobytes() copy of the canvas), shared by the
+        # theme variants, which write adjusted pixels into their own buffers
+        arr = _as_rgba_array(img, writable=False)
         logger.info(f"Resized to {target_size}x{target_size} with padding")
     except Exception as e:
         logger.error(f"Failed to resize image: {e}")
@@ -539,28 +754,27 @@ def main():
     light_output = output_dir / output_pattern.format(name=input_stem, theme='light')
     dark_output = output_dir / output_pattern.format(name=input_stem, theme='dark')
 
+    # Light theme is darkened for contrast on white, dark theme brightened for dark backgrounds
+    variants = [
+        ('light', args.brightness_light, light_output),
+        ('dark', args.brightness_dark, dark_output),
+    ]
+
+    # The outputs are independent, so encode them concurrently; parallel Numba
+    # kernels already use every core and must not be launched from two threads
+    max_workers = 1 if args.numba else len(variants) + 1
     try:
-        # Save transparent version (neutral base)
-        img.save(transparent_output)
-        logger.info(f"Saved neutral transparent logo: {transparent_output}")
-
-        # Generate light theme variant (darken for contrast on white background)
-        light_img = img.copy()
-        if args.brightness_light != 1.0:
-            light_img = adjust_brightness(light_img, args.brightness_light)
-            logger.info(f"Adjusted brightness for light theme: {args.brightness_light}x")
-        # Keep transparent background for icons
-        light_img.save(light_output)
-        logger.info(f"Saved light theme logo (transparent): {light_output}")
-
-        # Generate dark theme variant (brighten for contrast on dark background)
-        dark_img = img.copy()
-        if args.brightness_dark != 1.0:
-            dark_img = adjust_brightness(dark_img, args.brightness_dark)
-            logger.info(f"Adjusted brightness for dark theme: {args.brightness_dark}x")
-        # Keep transparent background for icons
-        dark_img.save(dark_output)
-        logger.info(f"Saved dark theme logo (transparent): {dark_output}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Save transparent version (neutral base)
+            neutral = executor.submit(img.save, transparent_output, **png_save_options(args.fast_png))
+            themed = [
+                executor.submit(save_theme_variant, arr, theme, factor, output_path, args.numba, args.fast_png)
+                for theme, factor, output_path in variants
+            ]
+            neutral.result()
+            logger.info(f"Saved neutral transparent logo: {transparent_output}")
+            for future in themed:
+                future.result()
 
     except Exception as e:
         logger.error(f"Failed to save logo variants: {e}")